@@ -15,16 +15,134 @@ Since this is a blockchain-based system, the "backend" consists of:
 """
 
 import sys
+import io
+import contextlib
 import json
 import os
+import re
+import stat
+import pickle
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+APP_ROOT = '/app'
+
+CONTENT_CACHE_PATH = '/app/.eigenvault_test_cache.pkl'
+
+REPORT_PATH = '/app/eigenvault_test_report.json'
+
+OPERATOR_CARGO_TOML = '/app/eigenvault/operator/Cargo.toml'
+
+REQUIRED_OPERATOR_MODULES = [
+    '/app/eigenvault/operator/src/main.rs',
+    '/app/eigenvault/operator/src/matching/mod.rs',
+    '/app/eigenvault/operator/src/proofs/mod.rs',
+    '/app/eigenvault/operator/src/networking/mod.rs',
+    '/app/eigenvault/operator/src/ethereum/mod.rs'
+]
+
+SCRIPT_DIR = '/app/scripts'
+
+EXPECTED_SCRIPTS = [
+    'deploy-production.sh',
+    'deploy-local.sh',
+    'start-operator.sh',
+    'test-system.sh',
+    'register-operators.sh'
+]
+
+FOUNDRY_CONFIG = '/app/eigenvault/foundry.toml'
+
+CONFIG_FILES = [
+    FOUNDRY_CONFIG,
+    '/app/eigenvault/operator/config.example.yaml',
+    '/app/frontend/package.json',
+    '/app/eigenvault/package.json'
+]
+
+ARCHITECTURE_DOC = '/app/docs/ARCHITECTURE.md'
+
+DOC_FILES = [
+    '/app/README.md',
+    '/app/eigenvault/README.md',
+    ARCHITECTURE_DOC,
+    '/app/docs/DEPLOYMENT.md'
+]
+
+EXECUTABLE_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+_PRAGMA_RE = re.compile(rb'pragma solidity')
+_DECL_RE = re.compile(rb'\b(?:contract|interface|library)\s')
+
+FUNCTION_PREFIX = b'function '
+
+# Key interface methods that should exist, as the declarations searched for
+# (tuples keep the reporting order; the frozensets below drive the matching)
+EXPECTED_IFACE_METHODS = {
+    interface_name: tuple(FUNCTION_PREFIX + method.encode() for method in methods)
+    for interface_name, methods in {
+        'IEigenVaultHook.sol': [
+            'routeToVault',
+            'executeVaultOrder',
+            'fallbackToAMM',
+            'getOrder'
+        ],
+        'IOrderVault.sol': [
+            'storeOrder',
+            'retrieveOrder',
+            'expireOrder',
+            'getVaultOrder'
+        ],
+        'IEigenVaultServiceManager.sol': [
+            'createMatchingTask',
+            'submitTaskResponse',
+            'registerOperator',
+            'getOperatorMetrics'
+        ]
+    }.items()
+}
+
+FRONTEND_FEATURES = {
+    # Key Web3 integration points
+    'useEigenVault.ts': (
+        b'ethers',
+        b'submitOrder',
+        b'getOrder',
+        b'connectWallet',
+        b'CONTRACT_ADDRESSES'
+    ),
+    # Wallet connectivity
+    'useWeb3.ts': (
+        b'MetaMask',
+        b'connectWallet',
+        b'switchNetwork',
+        b'getBalance'
+    )
+}
+
+EXPECTED_IFACE_METHOD_SETS = {name: frozenset(methods) for name, methods in EXPECTED_IFACE_METHODS.items()}
+FRONTEND_FEATURE_SETS = {name: frozenset(features) for name, features in FRONTEND_FEATURES.items()}
 
 class EigenVaultSystemTester:
     def __init__(self):
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self._results_lock = threading.Lock()
+        self._output = threading.local()
         self.system_components = {
             'smart_contracts': {
                 'EigenVaultHook.sol': '/app/eigenvault/contracts/src/EigenVaultHook.sol',
@@ -58,39 +176,213 @@ class EigenVaultSystemTester:
                 'useWeb3.ts': '/app/frontend/src/hooks/useWeb3.ts'
             }
         }
+        self._path_index: Set[str] = set()
+        self._mode_index: Dict[str, int] = {}
+        self._size_index: Dict[str, int] = {}
+        self._scanned_dirs: Set[str] = set()
+        # Built eagerly so the concurrently running tests never race on it
+        self._build_path_index()
+        # path -> (st_mtime_ns, st_size, content), persisted between runs
+        self._content_cache: Dict[str, Tuple[int, int, bytes]] = self._load_content_cache()
+        self._content_cache_dirty = False
+        self._automata: Dict[FrozenSet[bytes], Any] = {}
 
-    def run_test(self, name: str, test_func, *args, **kwargs) -> bool:
-        """Run a single test and record results"""
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        
+    def _probed_paths(self) -> List[str]:
+        """Collect every path the test suite checks for"""
+        paths = [path for files in self.system_components.values() for path in files.values()]
+        paths.append(OPERATOR_CARGO_TOML)
+        paths.extend(REQUIRED_OPERATOR_MODULES)
+        paths.extend(os.path.join(SCRIPT_DIR, script) for script in EXPECTED_SCRIPTS)
+        paths.extend(CONFIG_FILES)
+        paths.extend(DOC_FILES)
+        return paths
+
+    def _build_path_index(self) -> None:
+        """Index the probed paths with a single scandir walk of the app tree.
+
+        Only directories leading to a probed path are descended into, so
+        vendored trees such as node_modules or contract libs are never listed.
+        """
+        wanted_dirs = set()
+        for path in self._probed_paths():
+            parent = os.path.dirname(os.path.normpath(path))
+            while parent.startswith(APP_ROOT) and parent not in wanted_dirs:
+                wanted_dirs.add(parent)
+                parent = os.path.dirname(parent)
+        self._scan_directory(APP_ROOT, wanted_dirs)
+
+    def _scan_directory(self, directory: str, wanted_dirs: Set[str]) -> None:
+        """Record the entries of a directory and recurse into wanted subdirectories"""
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        self._scanned_dirs.add(directory)
+        with entries:
+            for entry in entries:
+                try:
+                    # Follow symlinks like os.path.exists/os.access would, so
+                    # dangling links stay absent and links report their target
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                self._path_index.add(entry.path)
+                self._mode_index[entry.path] = entry_stat.st_mode
+                self._size_index[entry.path] = entry_stat.st_size
+                if stat.S_ISDIR(entry_stat.st_mode):
+                    # Directory components are listed with a trailing slash
+                    self._path_index.add(entry.path + os.sep)
+                    if entry.path in wanted_dirs:
+                        self._scan_directory(entry.path, wanted_dirs)
+
+    def _exists(self, path: str) -> bool:
+        """Check a path against the index, or the filesystem if its directory was never scanned"""
+        if os.path.dirname(os.path.normpath(path)) in self._scanned_dirs:
+            return path in self._path_index
+        return os.path.exists(path)
+
+    def _mode(self, path: str) -> int:
+        """Return the st_mode of an existing path, preferring the scan results"""
+        mode = self._mode_index.get(path)
+        return os.stat(path).st_mode if mode is None else mode
+
+    def _size(self, path: str) -> int:
+        """Return the st_size of an existing path, preferring the scan results"""
+        size = self._size_index.get(path)
+        return os.stat(path).st_size if size is None else size
+
+    def _load_content_cache(self) -> Dict[str, Tuple[int, int, bytes]]:
+        """Load file contents cached by a previous run, if any.
+
+        Unpickling runs arbitrary code, so the cache is only trusted when it
+        is owned by the current user and not writable by anyone else.
+        """
+        try:
+            with open(CONTENT_CACHE_PATH, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    print(f"⚠️  Warning: Ignoring untrusted content cache {CONTENT_CACHE_PATH}")
+                    return {}
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save_content_cache(self) -> None:
+        """Persist cached file contents for the next run.
+
+        The pickle is written to a fresh 0600 temp file and renamed over the
+        cache path, so a loosely permissioned file or a planted symlink there
+        is replaced rather than written through.
+        """
+        if not self._content_cache_dirty:
+            return
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CONTENT_CACHE_PATH),
+                                            prefix='.eigenvault_test_cache.')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self._content_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CONTENT_CACHE_PATH)
+            tmp_path = None
+            self._content_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️  Warning: Could not save content cache: {str(e)}")
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+
+    def _read(self, path: str) -> bytes:
+        """Read a file's raw bytes, reusing cached contents while its mtime and size are unchanged"""
+        st = os.stat(path)
+        cached = self._content_cache.get(path)
+        if cached is not None and len(cached) == 3 and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        # Checks only search for ASCII tokens, so the contents are never decoded
+        with open(path, 'rb') as f:
+            content = f.read()
+        self._content_cache[path] = (st.st_mtime_ns, st.st_size, content)
+        self._content_cache_dirty = True
+        return content
+
+    def _find_patterns(self, content: bytes, patterns: FrozenSet[bytes]) -> Set[bytes]:
+        """Return the subset of patterns found in content.
+
+        With pyahocorasick installed every pattern is matched in a single
+        pass; otherwise each pattern is looked up with a substring scan.
+        """
+        if ahocorasick is None:
+            return {pattern for pattern in patterns if pattern in content}
+
+        # Unicode builds of pyahocorasick only accept str keys and input
+        unicode_build = bool(ahocorasick.unicode)
+        automaton = self._automata.get(patterns)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for pattern in patterns:
+                automaton.add_word(pattern.decode() if unicode_build else pattern, pattern)
+            automaton.make_automaton()
+            self._automata[patterns] = automaton
+        haystack = content.decode('utf-8', 'replace') if unicode_build else content
+        return {pattern for _, pattern in automaton.iter(haystack)}
+
+    def reserve_results(self, count: int) -> None:
+        """Pre-size test_results so concurrent tests can record into fixed slots"""
+        with self._results_lock:
+            self.test_results = [None] * count
+
+    def run_test(self, name: str, test_func, *args, result_slot: Optional[int] = None, **kwargs) -> bool:
+        """Run a single test and record results, into a reserved slot of test_results if given"""
+        # Buffer the test's output and emit it in one write, which also keeps
+        # concurrently running tests from interleaving their lines
+        self._output.buffer = io.StringIO()
         try:
-            result = test_func(*args, **kwargs)
-            if result:
+            self._log(f"\n🔍 Testing {name}...")
+            
+            try:
+                result = test_func(*args, **kwargs)
+                if result:
+                    self._log(f"✅ Passed - {name}")
+                    self._record_result(name, 'PASSED', 'Test completed successfully', result_slot)
+                    return True
+                else:
+                    self._log(f"❌ Failed - {name}")
+                    self._record_result(name, 'FAILED', 'Test failed validation', result_slot)
+                    return False
+            except Exception as e:
+                self._log(f"❌ Failed - {name}: {str(e)}")
+                self._record_result(name, 'ERROR', str(e), result_slot)
+                return False
+        finally:
+            sys.stdout.write(self._output.buffer.getvalue())
+            sys.stdout.flush()
+            self._output.buffer = None
+
+    def _log(self, message: str) -> None:
+        """Write a line to the current test's output buffer, or to stdout outside a test"""
+        buffer = getattr(self._output, 'buffer', None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.write(message + "\n")
+
+    def _record_result(self, name: str, status: str, details: str, result_slot: Optional[int] = None) -> None:
+        """Record a test result; safe to call from concurrent tests"""
+        result = {
+            'name': name,
+            'status': status,
+            'details': details
+        }
+        with self._results_lock:
+            self.tests_run += 1
+            if status == 'PASSED':
                 self.tests_passed += 1
-                print(f"✅ Passed - {name}")
-                self.test_results.append({
-                    'name': name,
-                    'status': 'PASSED',
-                    'details': 'Test completed successfully'
-                })
-                return True
+            if result_slot is None:
+                self.test_results.append(result)
             else:
-                print(f"❌ Failed - {name}")
-                self.test_results.append({
-                    'name': name,
-                    'status': 'FAILED',
-                    'details': 'Test failed validation'
-                })
-                return False
-        except Exception as e:
-            print(f"❌ Failed - {name}: {str(e)}")
-            self.test_results.append({
-                'name': name,
-                'status': 'ERROR',
-                'details': str(e)
-            })
-            return False
+                self.test_results[result_slot] = result
 
     def test_file_exists(self, file_path: str) -> bool:
         """Test if a file exists"""
@@ -98,249 +390,181 @@ class EigenVaultSystemTester:
 
     def test_smart_contract_structure(self) -> bool:
         """Test smart contract file structure and basic validation"""
-        print("📋 Validating Smart Contract Architecture...")
+        self._log("📋 Validating Smart Contract Architecture...")
         
         all_exist = True
         for category, files in self.system_components.items():
             if category in ['smart_contracts', 'libraries', 'interfaces']:
                 for name, path in files.items():
-                    if not os.path.exists(path):
-                        print(f"❌ Missing: {name} at {path}")
+                    if not self._exists(path):
+                        self._log(f"❌ Missing: {name} at {path}")
                         all_exist = False
                     else:
-                        print(f"✅ Found: {name}")
+                        self._log(f"✅ Found: {name}")
                         
                         # Basic content validation
-                        with open(path, 'r') as f:
-                            content = f.read()
-                            if 'pragma solidity' not in content:
-                                print(f"⚠️  Warning: {name} missing Solidity pragma")
-                            if 'contract ' not in content and 'interface ' not in content and 'library ' not in content:
-                                print(f"⚠️  Warning: {name} missing contract/interface/library declaration")
+                        content = self._read(path)
+                        if not _PRAGMA_RE.search(content):
+                            self._log(f"⚠️  Warning: {name} missing Solidity pragma")
+                        if not _DECL_RE.search(content):
+                            self._log(f"⚠️  Warning: {name} missing contract/interface/library declaration")
         
         return all_exist
 
     def test_contract_interfaces(self) -> bool:
         """Test contract interface definitions"""
-        print("🔌 Validating Contract Interfaces...")
-        
-        # Key interface methods that should exist
-        expected_methods = {
-            'IEigenVaultHook.sol': [
-                'routeToVault',
-                'executeVaultOrder',
-                'fallbackToAMM',
-                'getOrder'
-            ],
-            'IOrderVault.sol': [
-                'storeOrder',
-                'retrieveOrder',
-                'expireOrder',
-                'getVaultOrder'
-            ],
-            'IEigenVaultServiceManager.sol': [
-                'createMatchingTask',
-                'submitTaskResponse',
-                'registerOperator',
-                'getOperatorMetrics'
-            ]
-        }
+        self._log("🔌 Validating Contract Interfaces...")
         
         all_valid = True
-        for interface_name, methods in expected_methods.items():
+        for interface_name, declarations in EXPECTED_IFACE_METHODS.items():
             interface_path = self.system_components['interfaces'][interface_name]
-            if os.path.exists(interface_path):
-                with open(interface_path, 'r') as f:
-                    content = f.read()
-                    for method in methods:
-                        if f'function {method}' not in content:
-                            print(f"❌ Missing method {method} in {interface_name}")
-                            all_valid = False
-                        else:
-                            print(f"✅ Found method {method} in {interface_name}")
+            if self._exists(interface_path):
+                content = self._read(interface_path)
+                declaration_set = EXPECTED_IFACE_METHOD_SETS[interface_name]
+                missing = declaration_set - self._find_patterns(content, declaration_set)
+                for declaration in declarations:
+                    method = declaration[len(FUNCTION_PREFIX):].decode()
+                    if declaration in missing:
+                        self._log(f"❌ Missing method {method} in {interface_name}")
+                        all_valid = False
+                    else:
+                        self._log(f"✅ Found method {method} in {interface_name}")
             else:
-                print(f"❌ Interface file not found: {interface_name}")
+                self._log(f"❌ Interface file not found: {interface_name}")
                 all_valid = False
         
         return all_valid
 
     def test_operator_software_structure(self) -> bool:
         """Test operator software structure"""
-        print("🦀 Validating Rust Operator Software...")
+        self._log("🦀 Validating Rust Operator Software...")
         
-        cargo_toml = '/app/eigenvault/operator/Cargo.toml'
-        if not os.path.exists(cargo_toml):
-            print("❌ Missing Cargo.toml")
+        if not self._exists(OPERATOR_CARGO_TOML):
+            self._log("❌ Missing Cargo.toml")
             return False
         
         # Check Cargo.toml content
-        with open(cargo_toml, 'r') as f:
-            cargo_content = f.read()
-            if 'tokio' not in cargo_content:
-                print("⚠️  Warning: Missing tokio dependency for async runtime")
-            if 'ethers' not in cargo_content:
-                print("⚠️  Warning: Missing ethers dependency for Ethereum integration")
+        cargo_content = self._read(OPERATOR_CARGO_TOML)
+        if b'tokio' not in cargo_content:
+            self._log("⚠️  Warning: Missing tokio dependency for async runtime")
+        if b'ethers' not in cargo_content:
+            self._log("⚠️  Warning: Missing ethers dependency for Ethereum integration")
         
         # Check main modules
-        required_modules = [
-            '/app/eigenvault/operator/src/main.rs',
-            '/app/eigenvault/operator/src/matching/mod.rs',
-            '/app/eigenvault/operator/src/proofs/mod.rs',
-            '/app/eigenvault/operator/src/networking/mod.rs',
-            '/app/eigenvault/operator/src/ethereum/mod.rs'
-        ]
-        
         all_exist = True
-        for module in required_modules:
-            if os.path.exists(module):
-                print(f"✅ Found: {os.path.basename(module)}")
+        for module in REQUIRED_OPERATOR_MODULES:
+            if self._exists(module):
+                self._log(f"✅ Found: {os.path.basename(module)}")
             else:
-                print(f"❌ Missing: {module}")
+                self._log(f"❌ Missing: {module}")
                 all_exist = False
         
         return all_exist
 
     def test_zk_circuits(self) -> bool:
         """Test zero-knowledge circuit files"""
-        print("🔐 Validating Zero-Knowledge Circuits...")
+        self._log("🔐 Validating Zero-Knowledge Circuits...")
         
         circuits = self.system_components['circuits']
         all_exist = True
         
         for name, path in circuits.items():
-            if os.path.exists(path):
-                print(f"✅ Found: {name}")
-                with open(path, 'r') as f:
-                    content = f.read()
-                    if 'pragma circom' not in content:
-                        print(f"⚠️  Warning: {name} missing Circom pragma")
-                    if 'component main' not in content:
-                        print(f"⚠️  Warning: {name} missing main component")
+            if self._exists(path):
+                self._log(f"✅ Found: {name}")
+                content = self._read(path)
+                if b'pragma circom' not in content:
+                    self._log(f"⚠️  Warning: {name} missing Circom pragma")
+                if b'component main' not in content:
+                    self._log(f"⚠️  Warning: {name} missing main component")
             else:
-                print(f"❌ Missing: {name}")
+                self._log(f"❌ Missing: {name}")
                 all_exist = False
         
         return all_exist
 
     def test_frontend_integration(self) -> bool:
         """Test frontend Web3 integration"""
-        print("🌐 Validating Frontend Web3 Integration...")
+        self._log("🌐 Validating Frontend Web3 Integration...")
         
         frontend_files = self.system_components['frontend']
         all_exist = True
         
         for name, path in frontend_files.items():
-            if os.path.exists(path):
-                print(f"✅ Found: {name}")
-                with open(path, 'r') as f:
-                    content = f.read()
-                    
-                    if name == 'useEigenVault.ts':
-                        # Check for key Web3 integration points
-                        required_features = [
-                            'ethers',
-                            'submitOrder',
-                            'getOrder',
-                            'connectWallet',
-                            'CONTRACT_ADDRESSES'
-                        ]
-                        for feature in required_features:
-                            if feature in content:
-                                print(f"  ✅ Has {feature} integration")
-                            else:
-                                print(f"  ❌ Missing {feature} integration")
-                                all_exist = False
-                    
-                    elif name == 'useWeb3.ts':
-                        # Check for wallet connectivity
-                        wallet_features = [
-                            'MetaMask',
-                            'connectWallet',
-                            'switchNetwork',
-                            'getBalance'
-                        ]
-                        for feature in wallet_features:
-                            if feature in content:
-                                print(f"  ✅ Has {feature} functionality")
-                            else:
-                                print(f"  ❌ Missing {feature} functionality")
+            if self._exists(path):
+                self._log(f"✅ Found: {name}")
+                features = FRONTEND_FEATURES.get(name)
+                if features is None:
+                    continue
+                content = self._read(path)
+                feature_set = FRONTEND_FEATURE_SETS[name]
+                missing = feature_set - self._find_patterns(content, feature_set)
+                
+                if name == 'useEigenVault.ts':
+                    for feature in features:
+                        if feature in missing:
+                            self._log(f"  ❌ Missing {feature.decode()} integration")
+                            all_exist = False
+                        else:
+                            self._log(f"  ✅ Has {feature.decode()} integration")
+                
+                elif name == 'useWeb3.ts':
+                    for feature in features:
+                        if feature in missing:
+                            self._log(f"  ❌ Missing {feature.decode()} functionality")
+                        else:
+                            self._log(f"  ✅ Has {feature.decode()} functionality")
             else:
-                print(f"❌ Missing: {name}")
+                self._log(f"❌ Missing: {name}")
                 all_exist = False
         
         return all_exist
 
     def test_deployment_scripts(self) -> bool:
         """Test deployment and production scripts"""
-        print("🚀 Validating Deployment Scripts...")
-        
-        script_dir = '/app/scripts'
-        expected_scripts = [
-            'deploy-production.sh',
-            'deploy-local.sh',
-            'start-operator.sh',
-            'test-system.sh',
-            'register-operators.sh'
-        ]
+        self._log("🚀 Validating Deployment Scripts...")
         
         all_exist = True
-        for script in expected_scripts:
-            script_path = os.path.join(script_dir, script)
-            if os.path.exists(script_path):
-                print(f"✅ Found: {script}")
+        for script in EXPECTED_SCRIPTS:
+            script_path = os.path.join(SCRIPT_DIR, script)
+            if self._exists(script_path):
+                self._log(f"✅ Found: {script}")
                 # Check if script is executable
-                if os.access(script_path, os.X_OK):
-                    print(f"  ✅ {script} is executable")
+                if self._mode(script_path) & EXECUTABLE_BITS:
+                    self._log(f"  ✅ {script} is executable")
                 else:
-                    print(f"  ⚠️  {script} is not executable")
+                    self._log(f"  ⚠️  {script} is not executable")
             else:
-                print(f"❌ Missing: {script}")
+                self._log(f"❌ Missing: {script}")
                 all_exist = False
         
         return all_exist
 
     def test_configuration_files(self) -> bool:
         """Test configuration files"""
-        print("⚙️  Validating Configuration Files...")
-        
-        config_files = [
-            '/app/eigenvault/foundry.toml',
-            '/app/eigenvault/operator/config.example.yaml',
-            '/app/frontend/package.json',
-            '/app/eigenvault/package.json'
-        ]
+        self._log("⚙️  Validating Configuration Files...")
         
         all_exist = True
-        for config_file in config_files:
-            if os.path.exists(config_file):
-                print(f"✅ Found: {os.path.basename(config_file)}")
+        for config_file in CONFIG_FILES:
+            if self._exists(config_file):
+                self._log(f"✅ Found: {os.path.basename(config_file)}")
             else:
-                print(f"❌ Missing: {config_file}")
+                self._log(f"❌ Missing: {config_file}")
                 all_exist = False
         
         return all_exist
 
     def test_documentation(self) -> bool:
         """Test documentation completeness"""
-        print("📚 Validating Documentation...")
-        
-        doc_files = [
-            '/app/README.md',
-            '/app/eigenvault/README.md',
-            '/app/docs/ARCHITECTURE.md',
-            '/app/docs/DEPLOYMENT.md'
-        ]
+        self._log("📚 Validating Documentation...")
         
         all_exist = True
-        for doc_file in doc_files:
-            if os.path.exists(doc_file):
-                print(f"✅ Found: {os.path.basename(doc_file)}")
-                with open(doc_file, 'r') as f:
-                    content = f.read()
-                    if len(content) < 100:
-                        print(f"⚠️  Warning: {os.path.basename(doc_file)} seems incomplete")
+        for doc_file in DOC_FILES:
+            if self._exists(doc_file):
+                self._log(f"✅ Found: {os.path.basename(doc_file)}")
+                if self._size(doc_file) < 100:
+                    self._log(f"⚠️  Warning: {os.path.basename(doc_file)} seems incomplete")
             else:
-                print(f"❌ Missing: {doc_file}")
+                self._log(f"❌ Missing: {doc_file}")
                 all_exist = False
         
         return all_exist
@@ -354,12 +578,12 @@ class EigenVaultSystemTester:
         
         assessments = {
             'smart_contracts': self.tests_passed >= 3,
-            'operator_software': os.path.exists('/app/eigenvault/operator/Cargo.toml'),
-            'frontend_integration': os.path.exists('/app/frontend/src/hooks/useEigenVault.ts'),
-            'zk_circuits': os.path.exists('/app/circuits/order_matching.circom'),
-            'deployment_scripts': os.path.exists('/app/scripts/deploy-production.sh'),
-            'documentation': os.path.exists('/app/docs/ARCHITECTURE.md'),
-            'configuration': os.path.exists('/app/eigenvault/foundry.toml'),
+            'operator_software': self._exists(OPERATOR_CARGO_TOML),
+            'frontend_integration': self._exists(self.system_components['frontend']['useEigenVault.ts']),
+            'zk_circuits': self._exists(self.system_components['circuits']['order_matching.circom']),
+            'deployment_scripts': self._exists(os.path.join(SCRIPT_DIR, 'deploy-production.sh')),
+            'documentation': self._exists(ARCHITECTURE_DOC),
+            'configuration': self._exists(FOUNDRY_CONFIG),
             'testing_framework': self.tests_run > 0
         }
         
@@ -393,10 +617,11 @@ class EigenVaultSystemTester:
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive test report"""
+        timestamp = datetime.now().isoformat()
         readiness = self.assess_production_readiness()
         
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'summary': {
                 'tests_run': self.tests_run,
                 'tests_passed': self.tests_passed,
@@ -408,12 +633,18 @@ class EigenVaultSystemTester:
                 'smart_contracts': len(self.system_components['smart_contracts']),
                 'libraries': len(self.system_components['libraries']),
                 'interfaces': len(self.system_components['interfaces']),
-                'operator_modules': len([f for f in self.system_components['operator_software'].values() if os.path.exists(f)]),
+                'operator_modules': sum(1 for f in self.system_components['operator_software'].values() if self._exists(f)),
                 'circuits': len(self.system_components['circuits']),
                 'frontend_files': len(self.system_components['frontend'])
             }
         }
 
+def serialize_report(report: Dict[str, Any]) -> bytes:
+    """Serialize the report to indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2, ensure_ascii=False).encode()
+
 def main():
     """Main test execution"""
     print("🔐 EigenVault System Testing Suite")
@@ -433,8 +664,15 @@ def main():
         ("Documentation", tester.test_documentation)
     ]
     
-    for test_name, test_func in test_suite:
-        tester.run_test(test_name, test_func)
+    # Tests are I/O-bound and independent, so overlap them on a thread pool;
+    # each one records into its own slot to keep the report in suite order
+    tester.reserve_results(len(test_suite))
+    with ThreadPoolExecutor(max_workers=len(test_suite)) as executor:
+        futures = [executor.submit(tester.run_test, test_name, test_func, result_slot=i)
+                   for i, (test_name, test_func) in enumerate(test_suite)]
+        for future in as_completed(futures):
+            future.result()
+    tester.save_content_cache()
     
     # Generate and display report
     report = tester.generate_report()
@@ -449,10 +687,10 @@ def main():
     print(f"Recommendation: {report['production_readiness']['recommendation']}")
     
     # Save detailed report
-    with open('/app/eigenvault_test_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(REPORT_PATH, 'wb') as f:
+        f.write(serialize_report(report))
     
-    print(f"\n📄 Detailed report saved to: /app/eigenvault_test_report.json")
+    print(f"\n📄 Detailed report saved to: {REPORT_PATH}")
     
     return 0 if report['summary']['success_rate'] >= 75 else 1
 
@@ -0,0 +1,430 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest import mock
+
+import backend_test
+
+
+class EigenVaultSystemTesterTestCase(unittest.TestCase):
+    """Base case that points the tester's path constants at a temporary tree"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = os.path.realpath(self._tmp.name)
+
+        patches = {
+            'APP_ROOT': self.root,
+            'CONTENT_CACHE_PATH': self.path('.eigenvault_test_cache.pkl'),
+            'OPERATOR_CARGO_TOML': self.path('eigenvault/operator/Cargo.toml'),
+            'REQUIRED_OPERATOR_MODULES': [self.path('eigenvault/operator/src/main.rs')],
+            'SCRIPT_DIR': self.path('scripts'),
+            'EXPECTED_SCRIPTS': ['deploy-production.sh', 'deploy-local.sh'],
+            'FOUNDRY_CONFIG': self.path('eigenvault/foundry.toml'),
+            'CONFIG_FILES': [self.path('eigenvault/foundry.toml')],
+            'ARCHITECTURE_DOC': self.path('docs/ARCHITECTURE.md'),
+            'DOC_FILES': [self.path('README.md'), self.path('docs/ARCHITECTURE.md')],
+        }
+        for name, value in patches.items():
+            patcher = mock.patch.object(backend_test, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def path(self, relative_path: str) -> str:
+        return os.path.join(self.root, relative_path)
+
+    def write(self, relative_path: str, content: bytes = b'', mode: int = 0o644) -> str:
+        path = self.path(relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        os.chmod(path, mode)
+        return path
+
+    def make_tester(self) -> backend_test.EigenVaultSystemTester:
+        return backend_test.EigenVaultSystemTester()
+
+    def run_quietly(self, test_func):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            result = test_func()
+        return result, out.getvalue()
+
+
+class PathIndexTest(EigenVaultSystemTesterTestCase):
+
+    def test_indexes_probed_files_and_directories(self):
+        cargo = self.write('eigenvault/operator/Cargo.toml')
+        self.write('eigenvault/operator/src/main.rs')
+        tester = self.make_tester()
+
+        self.assertIn(cargo, tester._path_index)
+        self.assertIn(self.path('eigenvault/operator/src/main.rs'), tester._path_index)
+        self.assertIn(self.path('eigenvault/operator/src'), tester._path_index)
+        self.assertIn(self.path('eigenvault/operator/src') + os.sep, tester._path_index)
+        self.assertNotIn(self.path('eigenvault/operator/Cargo.toml') + os.sep, tester._path_index)
+
+    def test_does_not_descend_into_unprobed_directories(self):
+        self.write('eigenvault/foundry.toml')
+        self.write('frontend/node_modules/pkg/index.js')
+        tester = self.make_tester()
+
+        self.assertIn(self.path('frontend'), tester._path_index)
+        self.assertNotIn(self.path('frontend/node_modules'), tester._path_index)
+        self.assertNotIn(self.path('frontend/node_modules/pkg/index.js'), tester._path_index)
+
+    def test_missing_root_yields_empty_index(self):
+        with mock.patch.object(backend_test, 'APP_ROOT', self.path('does-not-exist')):
+            tester = self.make_tester()
+        self.assertEqual(tester._path_index, set())
+
+    def test_symlinked_script_uses_target_mode(self):
+        target = self.write('bin/deploy.sh', b'#!/bin/sh\n', mode=0o644)
+        executable = self.write('scripts/deploy-local.sh', b'#!/bin/sh\n', mode=0o755)
+        link = self.path('scripts/deploy-production.sh')
+        os.symlink(target, link)
+        tester = self.make_tester()
+
+        self.assertFalse(tester._mode_index[link] & backend_test.EXECUTABLE_BITS)
+        self.assertTrue(tester._mode_index[executable] & backend_test.EXECUTABLE_BITS)
+        result, output = self.run_quietly(tester.test_deployment_scripts)
+        self.assertTrue(result)
+        self.assertIn('deploy-production.sh is not executable', output)
+        self.assertIn('deploy-local.sh is executable', output)
+
+    def test_dangling_symlink_is_reported_missing(self):
+        self.write('README.md', b'x' * 200)
+        os.makedirs(self.path('docs'))
+        os.symlink(self.path('docs/gone.md'), self.path('docs/ARCHITECTURE.md'))
+        tester = self.make_tester()
+
+        self.assertNotIn(self.path('docs/ARCHITECTURE.md'), tester._path_index)
+        result, output = self.run_quietly(tester.test_documentation)
+        self.assertFalse(result)
+        self.assertIn(f"Missing: {self.path('docs/ARCHITECTURE.md')}", output)
+
+    def test_symlinked_doc_is_sized_by_target(self):
+        target = self.write('notes/readme.md', b'x' * 200)
+        os.symlink(target, self.path('README.md'))
+        self.write('docs/ARCHITECTURE.md', b'short')
+        tester = self.make_tester()
+
+        self.assertEqual(tester._size_index[self.path('README.md')], 200)
+        result, output = self.run_quietly(tester.test_documentation)
+        self.assertTrue(result)
+        self.assertNotIn('README.md seems incomplete', output)
+        self.assertIn('ARCHITECTURE.md seems incomplete', output)
+
+    def test_exists_answers_scanned_directories_from_index(self):
+        present = self.write('eigenvault/foundry.toml')
+        tester = self.make_tester()
+
+        with mock.patch.object(backend_test.os.path, 'exists', side_effect=AssertionError('stat')):
+            self.assertTrue(tester._exists(present))
+            self.assertFalse(tester._exists(self.path('eigenvault/missing.toml')))
+            self.assertTrue(tester._exists(self.path('eigenvault') + os.sep))
+
+    def test_exists_falls_back_outside_scanned_directories(self):
+        self.write('eigenvault/foundry.toml')
+        unprobed = self.write('monitoring/alerts/rules.yaml', mode=0o755)
+        tester = self.make_tester()
+
+        self.assertNotIn(unprobed, tester._path_index)
+        self.assertTrue(tester._exists(unprobed))
+        self.assertFalse(tester._exists(self.path('monitoring/alerts/missing.yaml')))
+        self.assertTrue(tester._mode(unprobed) & backend_test.EXECUTABLE_BITS)
+        self.assertEqual(tester._size(unprobed), 0)
+
+
+class FakeAhoCorasick:
+    """Minimal stand-in for the pyahocorasick module, in a unicode or bytes build"""
+
+    def __init__(self, unicode: bool):
+        self.unicode = int(unicode)
+        self.built = 0
+        module = self
+
+        class Automaton:
+            def __init__(self):
+                self._words = {}
+                module.built += 1
+
+            def _check(self, value):
+                expected = str if module.unicode else bytes
+                if not isinstance(value, expected):
+                    raise TypeError(f"expected {expected.__name__}, got {type(value).__name__}")
+
+            def add_word(self, word, value):
+                self._check(word)
+                self._words[word] = value
+
+            def make_automaton(self):
+                pass
+
+            def iter(self, haystack):
+                self._check(haystack)
+                for word, value in self._words.items():
+                    start = haystack.find(word)
+                    while start != -1:
+                        yield start + len(word) - 1, value
+                        start = haystack.find(word, start + 1)
+
+        self.Automaton = Automaton
+
+
+class PatternMatchingTest(EigenVaultSystemTesterTestCase):
+
+    def make_interface_tester(self) -> backend_test.EigenVaultSystemTester:
+        self.write('interfaces/IEigenVaultHook.sol',
+                   b'interface IEigenVaultHook {\n'
+                   b'    function routeToVault() external;\n'
+                   b'    function getOrder() external view;\n'
+                   b'    // function fallbackToAMM() \xe2\x9c\x93\n'
+                   b'}\n')
+        self.write('interfaces/IOrderVault.sol',
+                   b'function storeOrder(); function retrieveOrder(); function expireOrder(); function getVaultOrder();')
+        tester = self.make_tester()
+        tester.system_components['interfaces'] = {
+            'IEigenVaultHook.sol': self.path('interfaces/IEigenVaultHook.sol'),
+            'IOrderVault.sol': self.path('interfaces/IOrderVault.sol'),
+            'IEigenVaultServiceManager.sol': self.path('interfaces/IEigenVaultServiceManager.sol'),
+        }
+        return tester
+
+    def run_interfaces(self, ahocorasick_module):
+        tester = self.make_interface_tester()
+        with mock.patch.object(backend_test, 'ahocorasick', ahocorasick_module):
+            result, output = self.run_quietly(tester.test_contract_interfaces)
+        return tester, result, output
+
+    def test_fallback_reports_missing_methods(self):
+        _, result, output = self.run_interfaces(None)
+
+        self.assertFalse(result)
+        self.assertIn('❌ Missing method executeVaultOrder in IEigenVaultHook.sol', output)
+        self.assertIn('✅ Found method fallbackToAMM in IEigenVaultHook.sol', output)
+        self.assertIn('✅ Found method getVaultOrder in IOrderVault.sol', output)
+        self.assertIn('❌ Interface file not found: IEigenVaultServiceManager.sol', output)
+
+    def test_automaton_builds_match_fallback(self):
+        _, _, expected = self.run_interfaces(None)
+        for unicode in (True, False):
+            with self.subTest(unicode=unicode):
+                fake = FakeAhoCorasick(unicode)
+                tester, result, output = self.run_interfaces(fake)
+
+                self.assertFalse(result)
+                self.assertEqual(output, expected)
+                self.assertEqual(set(tester._automata),
+                                 {backend_test.EXPECTED_IFACE_METHOD_SETS['IEigenVaultHook.sol'],
+                                  backend_test.EXPECTED_IFACE_METHOD_SETS['IOrderVault.sol']})
+
+    def test_automata_are_reused_across_calls(self):
+        fake = FakeAhoCorasick(True)
+        tester = self.make_interface_tester()
+        with mock.patch.object(backend_test, 'ahocorasick', fake):
+            self.run_quietly(tester.test_contract_interfaces)
+            self.run_quietly(tester.test_contract_interfaces)
+        self.assertEqual(fake.built, 2)
+
+    def test_real_pyahocorasick_matches_fallback(self):
+        try:
+            import ahocorasick
+        except ImportError:
+            self.skipTest('pyahocorasick is not installed')
+        _, _, expected = self.run_interfaces(None)
+        _, _, output = self.run_interfaces(ahocorasick)
+        self.assertEqual(output, expected)
+
+
+class ProductionReadinessTest(EigenVaultSystemTesterTestCase):
+
+    def test_assessments_follow_patched_paths(self):
+        self.write('eigenvault/operator/Cargo.toml')
+        self.write('scripts/deploy-production.sh')
+        self.write('eigenvault/foundry.toml')
+        circuit = self.write('circuits/order_matching.circom')
+        tester = self.make_tester()
+        tester.system_components['circuits']['order_matching.circom'] = circuit
+        tester.system_components['frontend']['useEigenVault.ts'] = self.path('frontend/src/hooks/useEigenVault.ts')
+
+        readiness, _ = self.run_quietly(tester.assess_production_readiness)
+        assessments = readiness['assessments']
+        self.assertTrue(assessments['operator_software'])
+        self.assertTrue(assessments['deployment_scripts'])
+        self.assertTrue(assessments['configuration'])
+        self.assertTrue(assessments['zk_circuits'])
+        self.assertFalse(assessments['documentation'])
+        self.assertFalse(assessments['frontend_integration'])
+
+
+class ContentCacheTest(EigenVaultSystemTesterTestCase):
+
+    def rewrite_keeping_stat(self, path: str, content: bytes) -> None:
+        """Change a file's bytes while keeping its size and mtime"""
+        st = os.stat(path)
+        with open(path, 'wb') as f:
+            f.write(content)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def test_unchanged_file_is_served_from_cache(self):
+        path = self.write('README.md', b'first')
+        tester = self.make_tester()
+
+        self.assertEqual(tester._read(path), b'first')
+        self.rewrite_keeping_stat(path, b'other')
+        self.assertEqual(tester._read(path), b'first')
+
+    def test_changed_size_or_mtime_invalidates_entry(self):
+        path = self.write('README.md', b'first')
+        tester = self.make_tester()
+        tester._read(path)
+
+        self.write('README.md', b'longer content')
+        self.assertEqual(tester._read(path), b'longer content')
+
+        st = os.stat(path)
+        self.rewrite_keeping_stat(path, b'same size text')
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        self.assertEqual(tester._read(path), b'same size text')
+
+    def test_cache_persists_across_runs(self):
+        path = self.write('README.md', b'first')
+        tester = self.make_tester()
+        tester._read(path)
+        tester.save_content_cache()
+
+        self.rewrite_keeping_stat(path, b'other')
+        self.assertEqual(self.make_tester()._read(path), b'first')
+
+    def test_untrusted_cache_file_is_ignored(self):
+        path = self.write('README.md', b'first')
+        tester = self.make_tester()
+        tester._read(path)
+        tester.save_content_cache()
+        os.chmod(backend_test.CONTENT_CACHE_PATH, 0o666)
+
+        self.rewrite_keeping_stat(path, b'other')
+        tester, _ = self.run_quietly(self.make_tester)
+        self.assertEqual(tester._content_cache, {})
+        self.assertEqual(tester._read(path), b'other')
+
+    def test_save_replaces_untrusted_cache_file(self):
+        path = self.write('README.md', b'first')
+        cache_path = backend_test.CONTENT_CACHE_PATH
+        tester = self.make_tester()
+        tester._read(path)
+        tester.save_content_cache()
+        os.chmod(cache_path, 0o666)
+
+        tester, _ = self.run_quietly(self.make_tester)
+        tester._read(path)
+        tester.save_content_cache()
+
+        self.assertEqual(os.stat(cache_path).st_mode & 0o777, 0o600)
+        self.assertIn(path, self.make_tester()._content_cache)
+        self.assertEqual([name for name in os.listdir(self.root) if name.startswith('.eigenvault')],
+                         ['.eigenvault_test_cache.pkl'])
+
+    def test_save_replaces_symlink_at_cache_path(self):
+        path = self.write('README.md', b'first')
+        target = self.write('elsewhere.pkl', b'untouched')
+        os.symlink(target, backend_test.CONTENT_CACHE_PATH)
+        tester, _ = self.run_quietly(self.make_tester)
+        tester._read(path)
+        tester.save_content_cache()
+
+        self.assertFalse(os.path.islink(backend_test.CONTENT_CACHE_PATH))
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b'untouched')
+
+
+class ConcurrentRunTest(EigenVaultSystemTesterTestCase):
+
+    def run_concurrently(self, tester, test_suite, max_workers=8):
+        tester.reserve_results(len(test_suite))
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(tester.run_test, name, func, result_slot=i)
+                           for i, (name, func) in enumerate(test_suite)]
+                for future in as_completed(futures):
+                    future.result()
+        return out.getvalue()
+
+    def test_concurrent_results_are_counted_under_lock(self):
+        tester = self.make_tester()
+        test_suite = [(f'test {i}', (lambda passed: lambda: passed)(i % 2 == 0)) for i in range(64)]
+
+        self.run_concurrently(tester, test_suite)
+
+        self.assertEqual(tester.tests_run, 64)
+        self.assertEqual(tester.tests_passed, 32)
+        self.assertEqual(sum(result['status'] == 'PASSED' for result in tester.test_results), 32)
+
+    def test_results_are_recorded_in_slot_order(self):
+        tester = self.make_tester()
+
+        def finishing_after(delay, outcome):
+            def check():
+                time.sleep(delay)
+                if outcome is None:
+                    raise RuntimeError('boom')
+                return outcome
+            return check
+
+        # Earlier slots finish last, so completion order is the reverse of slot order
+        outcomes = [True, False, None, True]
+        test_suite = [(f'test {i}', finishing_after(0.02 * (len(outcomes) - i), outcome))
+                      for i, outcome in enumerate(outcomes)]
+        self.run_concurrently(tester, test_suite)
+
+        self.assertEqual([result['name'] for result in tester.test_results],
+                         ['test 0', 'test 1', 'test 2', 'test 3'])
+        self.assertEqual([result['status'] for result in tester.test_results],
+                         ['PASSED', 'FAILED', 'ERROR', 'PASSED'])
+        self.assertEqual(tester.test_results[2]['details'], 'boom')
+        self.assertEqual((tester.tests_run, tester.tests_passed), (4, 2))
+
+    def test_run_test_without_slot_appends(self):
+        tester = self.make_tester()
+        self.run_quietly(lambda: tester.run_test('first', lambda: True))
+        self.run_quietly(lambda: tester.run_test('second', lambda: False))
+
+        self.assertEqual([result['name'] for result in tester.test_results], ['first', 'second'])
+
+    def test_each_test_output_is_one_contiguous_block(self):
+        tester = self.make_tester()
+
+        def chatty(name):
+            def check():
+                for line in range(5):
+                    tester._log(f'{name} line {line}')
+                    time.sleep(0.002)
+                return True
+            return check
+
+        names = [f'test{i}' for i in range(6)]
+        output = self.run_concurrently(tester, [(name, chatty(name)) for name in names])
+
+        blocks = output.split('\n🔍 Testing ')[1:]
+        self.assertEqual(sorted(block.split('...', 1)[0] for block in blocks), names)
+        for block in blocks:
+            name = block.split('...', 1)[0]
+            self.assertEqual(block.splitlines(), [
+                f'{name}...',
+                *(f'{name} line {line}' for line in range(5)),
+                f'✅ Passed - {name}',
+            ])
+
+    def test_log_outside_run_test_prints_directly(self):
+        tester = self.make_tester()
+        _, output = self.run_quietly(lambda: tester._log('standalone'))
+        self.assertEqual(output, 'standalone\n')
+
+
+if __name__ == '__main__':
+    unittest.main()